@@ -1,7 +1,7 @@
 import inspect
 from abc import ABC, abstractmethod
 from types import FunctionType
-from typing import Any, Dict, Iterator, Optional, Set, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from aiohttp.web_request import Request
 from typing_extensions import get_args
@@ -9,7 +9,7 @@ from typing_extensions import get_args
 from rapidy._annotation_extractor import extract_handler_attr_annotations, NotParameterError
 from rapidy._client_errors import _create_handler_attr_info_msg, _create_handler_info_msg, ExtractError
 from rapidy._fields import ModelField
-from rapidy._validators import validate_request_param_data
+from rapidy._validators import create_field_validator, validate_request_param_data, ValidationField
 from rapidy.request_params import create_param_model_field_by_request_param, ParamFieldInfo, ParamType, ValidateType
 from rapidy.typedefs import Handler, MethodHandler, Middleware, NoArgAnyCallable, ValidateReturn
 
@@ -60,9 +60,16 @@ class RequestParamError(Exception):
         )
 
 
+# NOTE: extracted data may be legitimately empty, so a cache miss is told apart by identity
+_CACHE_MISS: Any = object()
+
+
 class ParamAnnotationContainer(ABC):
+    __slots__ = ('_extractor', '_extractor_is_async', '_param_type')
+
     def __init__(self, extractor: Any, param_type: ParamType) -> None:
         self._extractor = extractor
+        self._extractor_is_async = inspect.iscoroutinefunction(extractor)
         self._param_type = param_type
 
     @abstractmethod
@@ -83,8 +90,28 @@ class ParamAnnotationContainer(ABC):
     ) -> None:  # pragma: no cover
         pass
 
+    async def _extract_request_data(self, request: Request) -> Tuple[Any, List[Any]]:
+        request_cache = request._cache  # FIXME: cache management should be centralized
+        param_type = self._param_type
+
+        raw_data = request_cache.get(param_type, _CACHE_MISS)
+        if raw_data is _CACHE_MISS:
+            try:
+                if self._extractor_is_async:
+                    raw_data = await self._extractor(request)
+                else:
+                    raw_data = self._extractor(request)
+            except ExtractError as exc:
+                return None, [exc.get_error_info(loc=(param_type,))]
+
+            request_cache[param_type] = raw_data
+
+        return raw_data, []
+
 
 class ParamAnnotationContainerOnlyExtract(ParamAnnotationContainer):
+    __slots__ = ('_param_name', '_param_default', '_param_default_factory', '_is_defined')
+
     def __init__(self, extractor: Any, param_type: ParamType, param_name: str) -> None:
         super().__init__(extractor=extractor, param_type=param_type)
         self._param_name = param_name
@@ -109,42 +136,33 @@ class ParamAnnotationContainerOnlyExtract(ParamAnnotationContainer):
             self,
             request: Request,
     ) -> ValidateReturn:
-        raw_data = request._cache.get(self._param_type)  # FIXME: cache management should be centralized
-        if raw_data:
-            return raw_data
-
-        try:
-            raw_data = await self._extractor(request)
-        except ExtractError as exc:
-            return {}, [exc.get_error_info(loc=(self._param_type,))]
-
-        request._cache[self._param_type] = raw_data  # FIXME: cache management should be centralized
+        raw_data, extract_errors = await self._extract_request_data(request)
+        if extract_errors:
+            return {}, extract_errors
 
         return {self._param_name: raw_data}, []
 
 
 class ValidateParamAnnotationContainer(ParamAnnotationContainer, ABC):
+    __slots__ = ('_map_model_fields_by_alias', '_validation_fields')
+
     single_model: bool
 
     def __init__(self, extractor: Any, param_type: ParamType):
         super().__init__(extractor=extractor, param_type=param_type)
         self._map_model_fields_by_alias: Dict[str, ModelField] = {}
+        self._validation_fields: Tuple[ValidationField, ...] = ()
 
     async def get_request_data(
             self,
             request: Request,
     ) -> ValidateReturn:
-        raw_data = request._cache.get(self._param_type)  # FIXME: cache management should be centralized
-        if not raw_data:
-            try:
-                raw_data = await self._extractor(request)
-            except ExtractError as exc:
-                return {}, [exc.get_error_info(loc=(self._param_type,))]
-
-            request._cache[self._param_type] = raw_data  # FIXME: cache management should be centralized
+        raw_data, extract_errors = await self._extract_request_data(request)
+        if extract_errors:
+            return {}, extract_errors
 
         return validate_request_param_data(
-            required_fields_map=self._map_model_fields_by_alias,
+            validation_fields=self._validation_fields,
             raw_data=raw_data,
             is_single_model=self.single_model,
         )
@@ -170,9 +188,20 @@ class ValidateParamAnnotationContainer(ParamAnnotationContainer, ABC):
             raise AttributeAlreadyExistError
 
         self._map_model_fields_by_alias[extraction_name] = model_field
+        loc = (self._param_type,) if self.single_model else (self._param_type, model_field.alias)
+        self._validation_fields += (
+            ValidationField(
+                extraction_name=extraction_name,
+                loc=loc,
+                name=model_field.name,
+                validate=create_field_validator(model_field),
+            ),
+        )
 
 
 class ParamAnnotationContainerValidateSchema(ValidateParamAnnotationContainer):
+    __slots__ = ('_is_defined',)
+
     single_model = True
 
     def __init__(self, extractor: Any, param_type: ParamType):
@@ -195,6 +224,8 @@ class ParamAnnotationContainerValidateSchema(ValidateParamAnnotationContainer):
 
 
 class ParamAnnotationContainerValidateParams(ValidateParamAnnotationContainer):
+    __slots__ = ('_added_field_info_types',)
+
     single_model = False
 
     def __init__(self, extractor: Any, param_type: ParamType) -> None:
@@ -233,6 +264,8 @@ def param_factory(
 
 
 class AnnotationContainer:
+    __slots__ = ('_handler', '_params', '_request_exists', '_request_param_name')
+
     def __init__(
             self,
             handler: Union[Handler, MethodHandler, Middleware],
@@ -243,9 +276,7 @@ class AnnotationContainer:
         self._request_param_name: Optional[str] = None
 
     def __iter__(self) -> Iterator[ParamAnnotationContainer]:
-        for param_container in self._params.values():
-            if param_container:
-                yield param_container
+        return iter(self._params.values())
 
     def set_request_field(self, request_param_name: str) -> None:
         if self.request_exists:
@@ -343,19 +374,17 @@ def create_annotation_container(
 
             continue
 
-        if isinstance(param_field_info, ParamFieldInfo):
-            try:
-                container.add_param(
-                    annotation=annotation,
-                    field_info=param_field_info,
-                    name=param_name,
-                    default=default,
-                    default_factory=param_field_info.default_factory,
-                )
-            except AnnotationContainerAddFieldError as annotation_container_add_field_error:
-                raise RequestParamError(handler=handler) from annotation_container_add_field_error
-
-        else:  # pragma: no cover
-            raise
+        assert isinstance(param_field_info, ParamFieldInfo), '`param_field_info` must be a ParamFieldInfo instance'
+
+        try:
+            container.add_param(
+                annotation=annotation,
+                field_info=param_field_info,
+                name=param_name,
+                default=default,
+                default_factory=param_field_info.default_factory,
+            )
+        except AnnotationContainerAddFieldError as annotation_container_add_field_error:
+            raise RequestParamError(handler=handler) from annotation_container_add_field_error
 
     return container
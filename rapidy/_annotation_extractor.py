@@ -9,6 +9,8 @@ from rapidy._client_errors import _create_handler_attr_info_msg
 from rapidy.request_params import ParamFieldInfo
 from rapidy.typedefs import Handler, Required, Undefined
 
+_NONE_TYPE = type(None)
+
 
 class AnnotationData(NamedTuple):
     type_: Any
@@ -100,7 +102,7 @@ def _get_annotation_data_by_default_value_flow(
 
 def _get_annotation_data(
         handler: Handler,
-        param: Any,
+        param: inspect.Parameter,
 ) -> AnnotationData:
     annotation_origin = get_origin(param.annotation)
 
@@ -137,7 +139,7 @@ def _prepare_field_info(raw_field_info: Union[ParamFieldInfo, Type[ParamFieldInf
 
 def _get_annotated_definition_attr_default(
         handler: Handler,
-        param: Any,
+        param: inspect.Parameter,
         field_info: ParamFieldInfo,
 ) -> Any:
     default_value_for_param_exists = param.default is not inspect.Signature.empty
@@ -217,7 +219,7 @@ def _raise_if_unsupported_union_schema_data_type(
         handler: Handler,
         param_name: str,
 ) -> None:
-    if not (len(union_attributes) == 2 and type(None) in union_attributes):  # noqa: WPS516
+    if not (len(union_attributes) == 2 and _NONE_TYPE in union_attributes):
         raise UnsupportedSchemaDataTypeError(
             err_msg='Schema annotated type must be a pydantic.BaseModel or dataclasses.dataclass.',
             handler=handler,
@@ -263,7 +265,9 @@ def extract_handler_attr_annotations(
 
             _raise_if_unsupported_union_schema_data_type(union_attributes, handler=handler, param_name=param.name)
 
-            checked_annotation_type = union_attributes[1] if union_attributes[0] is None else union_attributes[0]
+            checked_annotation_type = next(
+                union_attr for union_attr in union_attributes if union_attr is not _NONE_TYPE
+            )
 
         _raise_if_unsupported_annotation_type(checked_annotation_type, handler=handler, param_name=param.name)
 
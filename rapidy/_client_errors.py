@@ -1,22 +1,42 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple, Type, Union
-
-from pydantic import BaseModel, create_model
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Iterator, List, Tuple, Type, Union
 
 from rapidy.constants import PYDANTIC_V1, PYDANTIC_V2
 from rapidy.typedefs import ErrorWrapper, ValidationErrorList
 
-RequestErrorModel: Type[BaseModel] = create_model('Request')
+
+def _compile_msg_template(msg_template: str) -> str:
+    compiled_template_parts: List[str] = []
+    for literal_text, field_name, format_spec, conversion in Formatter().parse(msg_template):
+        compiled_template_parts.append(literal_text.replace('%', '%%'))
+        if field_name is None:
+            continue
+
+        if format_spec or conversion or not field_name.isidentifier():
+            raise ValueError(f'Unsupported placeholder `{{{field_name}}}` in error msg_template: {msg_template!r}')
+
+        compiled_template_parts.append(f'%({field_name})s')
+
+    return ''.join(compiled_template_parts)
 
 
-class ClientBaseError(ABC, ValueError):
+class ClientBaseError(ValueError):
+    __slots__ = ('_err_msg',)
+
     type: str
     msg_template: str
+    _compiled_msg_template: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        msg_template = getattr(cls, 'msg_template', None)
+        if msg_template is not None:
+            cls._compiled_msg_template = _compile_msg_template(msg_template)
 
     def __init__(self, *_: Any, **error_ctx: Any) -> None:
-        self._err_msg = self.msg_template.format(**error_ctx)
+        self._err_msg = self._compiled_msg_template % error_ctx
 
-    @abstractmethod
     def get_error_info(
             self,
             loc: Tuple[str, ...],
@@ -25,107 +45,180 @@ class ClientBaseError(ABC, ValueError):
 
 
 if PYDANTIC_V1:
+    from pydantic import BaseModel, create_model
     from pydantic.error_wrappers import ValidationError
 
-    class ClientError(ClientBaseError, ABC):
-        def get_error_info(
-                self,
-                loc: Tuple[str, ...],
-        ) -> Dict[str, Any]:
-            return {
-                'loc': loc,
-                'msg': self._err_msg,
-                'type': self.type,
-            }
-
-    class RequiredFieldIsMissing(ClientError):
-        type = 'value_error.missing'
-        msg_template = 'field required'
+    _MISSING_ERROR_TYPE = 'value_error.missing'
+    _MISSING_ERROR_MSG_TEMPLATE = 'field required'
+
+    def _create_error_info(
+            error_type: str,
+            error_msg: str,
+            loc: Tuple[str, ...],
+    ) -> Dict[str, Any]:
+        return {
+            'loc': loc,
+            'msg': error_msg,
+            'type': error_type,
+        }
+
+    def _create_missing_error_info(loc: Tuple[str, ...]) -> Dict[str, Any]:
+        return {
+            'loc': loc,
+            'msg': _MISSING_ERROR_MSG_TEMPLATE,
+            'type': _MISSING_ERROR_TYPE,
+        }
 
     def _regenerate_error_with_loc(
             *,
             errors: List[Any],
             loc_prefix: Tuple[Union[str, int], ...],
     ) -> List[Dict[str, Any]]:
-        return [
-            {**err, 'loc': loc_prefix + err.get('loc', ())}
-            for err in _normalize_errors(errors)
-        ]
+        regenerated_errors: List[Dict[str, Any]] = []
+        for err in _iter_normalized_errors(errors):
+            regenerated_err = err.copy()
+            regenerated_err['loc'] = loc_prefix + err.get('loc', ())
+            regenerated_errors.append(regenerated_err)
+
+        return regenerated_errors
+
+    @lru_cache(maxsize=None)
+    def _get_request_error_model() -> Type[BaseModel]:
+        return create_model('Request')
 
     def _normalize_errors(errors: List[Any]) -> List[Dict[str, Any]]:
-        use_errors: List[Dict[str, Any]] = []
-        for error in errors:
+        return list(_iter_normalized_errors(errors))
+
+    def _normalize_error_wrapper(error: ErrorWrapper) -> List[Dict[str, Any]]:
+        return ValidationError(errors=[error], model=_get_request_error_model()).errors()
+
+    def _iter_normalized_errors(errors: List[Any]) -> Iterator[Dict[str, Any]]:
+        pending_errors = list(reversed(errors))
+        while pending_errors:
+            error = pending_errors.pop()
             if isinstance(error, ErrorWrapper):
-                new_errors = ValidationError(errors=[error], model=RequestErrorModel).errors()
-                use_errors.extend(new_errors)
+                yield from _normalize_error_wrapper(error)
             elif isinstance(error, list):
-                use_errors.extend(_normalize_errors(error))
+                pending_errors.extend(reversed(error))
             else:
-                use_errors.append(error)
-        return use_errors
+                yield error
 
 elif PYDANTIC_V2:
     from pydantic import ValidationError
     from pydantic_core import InitErrorDetails, PydanticCustomError
 
-    class ClientError(ClientBaseError, ABC):  # type: ignore[no-redef]
-        def get_error_info(
-                self,
-                loc: Tuple[str, ...],
-        ) -> Dict[str, Any]:
-            err = PydanticCustomError(self.type, self._err_msg)
-            err_details = InitErrorDetails(type=err, loc=loc, input=input)
-            return ValidationError.from_exception_data(
-                title='',
-                line_errors=[err_details],
-                hide_input=True,
-            ).errors()[0]
-
-    class RequiredFieldIsMissing(ClientError):  # type: ignore[no-redef]
-        type = 'missing'
-        msg_template = 'Field required'
+    _MISSING_ERROR_TYPE = 'missing'
+    _MISSING_ERROR_MSG_TEMPLATE = 'Field required'
+
+    _validation_error_from_exception_data = ValidationError.from_exception_data
+
+    def _create_error_info(
+            error_type: str,
+            error_msg: str,
+            loc: Tuple[str, ...],
+    ) -> Dict[str, Any]:
+        # NOTE: copy the cached dict - the error list is handed over to the user and may be mutated
+        return _create_cached_error_info(error_type, error_msg, loc).copy()
+
+    def _create_missing_error_info(loc: Tuple[str, ...]) -> Dict[str, Any]:
+        # NOTE: must match pydantic's own `missing` error once `url` and `input` are dropped
+        return {
+            'type': _MISSING_ERROR_TYPE,
+            'loc': loc,
+            'msg': _MISSING_ERROR_MSG_TEMPLATE,
+        }
+
+    @lru_cache(maxsize=1024)
+    def _create_cached_error_info(
+            error_type: str,
+            error_msg: str,
+            loc: Tuple[str, ...],
+    ) -> Dict[str, Any]:
+        error_info = _validation_error_from_exception_data(
+            title='',
+            line_errors=[InitErrorDetails(type=PydanticCustomError(error_type, error_msg), loc=loc, input=None)],
+            hide_input=True,
+        ).errors()[0]
+        error_info.pop('url', None)
+        error_info.pop('input', None)
+        return error_info
 
     def _regenerate_error_with_loc(
             *,
             errors: List[Any],
             loc_prefix: Tuple[Union[str, int], ...],
     ) -> List[Dict[str, Any]]:
-        return [
-            {**err, 'loc': loc_prefix + err.get('loc', ())}
-            for err in errors
-        ]
+        # NOTE: errors are updated in place - callers pass the fresh list built by `ValidationError.errors()`,
+        # and normalizing in the same pass leaves nothing for `_normalize_errors` to do
+        for err in errors:
+            err.pop('url', None)
+            err.pop('input', None)
+            err['loc'] = loc_prefix + err.get('loc', ())
+
+        return errors
 
     def _normalize_errors(errors: List[Any]) -> ValidationErrorList:
-        for error in errors:  # TODO: FIXME
-            error.pop('url', None)
-            error.pop('input', None)
+        # NOTE: `_create_error_info` and `_regenerate_error_with_loc` already drop `url` and `input`
         return errors
 
 else:
     raise Exception
 
 
-class ExtractError(ClientError, ABC):
-    pass
+class ClientError(ClientBaseError):
+    __slots__ = ()
 
+    def get_error_info(
+            self,
+            loc: Tuple[str, ...],
+    ) -> Dict[str, Any]:
+        return _create_error_info(self.type, self._err_msg, loc)
+
+
+class RequiredFieldIsMissing(ClientError):
+    __slots__ = ()
+
+    type = _MISSING_ERROR_TYPE
+    msg_template = _MISSING_ERROR_MSG_TEMPLATE
+
+    def get_error_info(
+            self,
+            loc: Tuple[str, ...],
+    ) -> Dict[str, Any]:
+        return _create_missing_error_info(loc)
+
+
+class ExtractError(ClientError):
+    __slots__ = ()
+
+
+class ExtractBodyError(ExtractError):
+    __slots__ = ()
 
-class ExtractBodyError(ExtractError, ABC):
     type = 'body_extraction'
 
 
 class BodyDataSizeExceedError(ExtractBodyError):
+    __slots__ = ()
+
     msg_template = 'Failed to extract body data. Body data exceeds the allowed size `{body_max_size}`'
 
 
 class ExtractJsonError(ExtractBodyError):
+    __slots__ = ()
+
     msg_template = 'Failed to extract body data as Json: {json_decode_err_msg}'
 
 
 class ExtractMultipartError(ExtractBodyError):
+    __slots__ = ()
+
     msg_template = 'Failed to extract body data as Multipart: {multipart_error}'
 
 
 class ExtractMultipartPartError(ExtractMultipartError):
+    __slots__ = ()
+
     msg_template = 'Failed to extract body data as Multipart. Failed to read part `{part_num}`: {multipart_error}'
 
 
@@ -1,12 +1,11 @@
 from json import JSONDecodeError
-from typing import cast, Dict, Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 from urllib.parse import parse_qsl, unquote
 
 from aiohttp import BodyPartReader, MultipartReader
 from aiohttp.abc import Request
 from aiohttp.streams import EmptyStreamReader, StreamReader
 from aiohttp.typedefs import JSONDecoder
-from multidict import MultiDict
 
 from rapidy import hdrs
 from rapidy._client_errors import (
@@ -15,29 +14,29 @@ from rapidy._client_errors import (
     ExtractMultipartError,
     ExtractMultipartPartError,
 )
-from rapidy._parsers import parse_multi_params
+from rapidy._parsers import parse_multi_params, parse_params_pairs
 from rapidy.media_types import ApplicationJSON
 from rapidy.typedefs import DictStrAny, DictStrListAny, DictStrListStr, DictStrStr
 
 
-async def extract_path(request: Request) -> DictStrStr:
+def extract_path(request: Request) -> DictStrStr:
     return dict(request.match_info)
 
 
-async def extract_headers(request: Request) -> DictStrStr:
+def extract_headers(request: Request) -> DictStrStr:
     return parse_multi_params(request.headers)  # type: ignore[return-value]
 
 
-async def extract_cookies(request: Request) -> DictStrStr:
+def extract_cookies(request: Request) -> DictStrStr:
     cookies = request.cookies
     return dict(cookies)
 
 
-async def extract_query(request: Request) -> DictStrStr:
+def extract_query(request: Request) -> DictStrStr:
     return parse_multi_params(request.rel_url.query)  # type: ignore[return-value]
 
 
-async def extract_body_stream(request: Request, max_size: int) -> StreamReader:
+def extract_body_stream(request: Request, max_size: int) -> StreamReader:
     # TODO: custom StreamReader with body_max_size
     return request.content
 
@@ -82,27 +81,12 @@ async def extract_body_x_www_form(
 
     text_body = await extract_body_text(request=request, max_size=max_size)
     unquotes_text = unquote(text_body)
-    key_value_arr = parse_qsl(unquotes_text)
 
-    data: Union[MultiDict[str], Dict[str, str]]
-
-    if duplicated_attrs_parse_as_array:
-        data = MultiDict()
-    else:
-        data = {}
-
-    for key, value in key_value_arr:
-        if attrs_case_sensitive is False:
-            key = key.lower()
-
-        if duplicated_attrs_parse_as_array:
-            # NOTE: Mandatory operation, otherwise all duplicate keys will be overwritten
-            data = cast(MultiDict[str], data)
-            data.add(key, value)
-        else:
-            data[key] = value
-
-    return parse_multi_params(data, parse_as_array=duplicated_attrs_parse_as_array)
+    return parse_params_pairs(
+        parse_qsl(unquotes_text),
+        parse_as_array=duplicated_attrs_parse_as_array,
+        lower_keys=not attrs_case_sensitive,
+    )
 
 
 async def extract_body_multi_part(
@@ -116,12 +100,7 @@ async def extract_body_multi_part(
 
     multipart_reader = await _get_multipart_reader(request)
 
-    data: Union[MultiDict[Union[bytearray, str]], Dict[str, Union[bytearray, str]]]
-
-    if duplicated_attrs_parse_as_array:
-        data = MultiDict()
-    else:
-        data = {}
+    parts: List[Tuple[str, Union[bytearray, str]]] = []
 
     part_num = 1
 
@@ -146,20 +125,15 @@ async def extract_body_multi_part(
         available_bytes_to_read = updated_available_bytes_to_read
 
         payload = _get_part_data_payload(part=part, part_data=part_data)
-
-        if attrs_case_sensitive is False:
-            part_name = part_name.lower()
-
-        if duplicated_attrs_parse_as_array:
-            # NOTE: Mandatory operation, otherwise all duplicate keys will be overwritten
-            data = cast(MultiDict[Union[bytearray, str]], data)
-            data.add(part_name, payload)
-        else:
-            data[part_name] = payload
+        parts.append((part_name, payload))
 
         part_num += 1
 
-    return parse_multi_params(data, parse_as_array=duplicated_attrs_parse_as_array)
+    return parse_params_pairs(
+        parts,
+        parse_as_array=duplicated_attrs_parse_as_array,
+        lower_keys=not attrs_case_sensitive,
+    )
 
 
 async def _get_multipart_reader(request: Request) -> MultipartReader:
@@ -273,24 +247,21 @@ async def _read_request_buffer_chunk(n: int, request: Request) -> bytes:  # prag
 async def _read_full_body(request: Request, max_size: int) -> bytes:
     if request._read_bytes is None:  # noqa:  WPS437
         available_bytes_to_read = max_size
-        body = bytearray()
-        while True:
-            if available_bytes_to_read > 0:
-                chunk = await _read_request_buffer_chunk(available_bytes_to_read, request)
-                body.extend(chunk)
-                available_bytes_to_read -= len(chunk)
-
-                if not chunk:
-                    break
+        body_chunks: List[bytes] = []
+        while available_bytes_to_read > 0:
+            chunk = await _read_request_buffer_chunk(available_bytes_to_read, request)
+            if not chunk:
+                break
 
-            else:
-                is_body_size_exceeded = bool(await _read_request_buffer_chunk(1, request))
-                if is_body_size_exceeded:
-                    raise BodyDataSizeExceedError(body_max_size=max_size)
+            body_chunks.append(chunk)
+            available_bytes_to_read -= len(chunk)
 
-                break
+        if available_bytes_to_read <= 0:
+            is_body_size_exceeded = bool(await _read_request_buffer_chunk(1, request))
+            if is_body_size_exceeded:
+                raise BodyDataSizeExceedError(body_max_size=max_size)
 
-        request._read_bytes = bytes(body)  # noqa:  WPS437
+        request._read_bytes = b''.join(body_chunks)  # noqa:  WPS437
 
     return request._read_bytes  # noqa:  WPS437
 
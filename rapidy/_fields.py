@@ -1,4 +1,5 @@
 from abc import ABC
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple, Type, TYPE_CHECKING, Union
 
 from pydantic import ValidationError
@@ -102,44 +103,72 @@ if PYDANTIC_V1:  # noqa: C901
             ) from None
 
 elif PYDANTIC_V2:
-    from dataclasses import dataclass  # noqa: WPS433
-
     from pydantic import TypeAdapter  # noqa: WPS433
 
     def get_annotation_from_field_info(annotation: Any, field_info: FieldInfo, field_name: str) -> Any:  # noqa: WPS440
         return annotation
 
-    @dataclass
-    class ModelField:  # type: ignore[no-redef]  # noqa: WPS440
-        name: str
-        field_info: FieldInfo
-        rapid_param_type: ParamType
+    _EXACT_TYPE_PASSTHROUGH = (str, int, float, bool, bytes)
 
-        @property
-        def alias(self) -> str:
-            alias = self.field_info.alias
-            return alias if alias is not None else self.name
+    def _get_type_adapter(field_info: FieldInfo) -> 'TypeAdapter[Any]':
+        # NOTE: constrained fields are not shared - equal constraints such as `Gt(1)` and `Gt(1.0)` report different ctx
+        if field_info.metadata:
+            return _create_type_adapter(field_info)
 
-        @property
-        def required(self) -> bool:
-            return self.field_info.is_required()
+        try:
+            return _get_unconstrained_type_adapter(
+                field_info.annotation,  # type: ignore[arg-type]
+                field_info.discriminator,
+            )
+        except TypeError:  # NOTE: unhashable annotation
+            return _create_type_adapter(field_info)
+
+    @lru_cache(maxsize=1024)
+    def _get_unconstrained_type_adapter(annotation: Any, discriminator: Any) -> 'TypeAdapter[Any]':
+        return _create_type_adapter(FieldInfo(annotation=annotation, discriminator=discriminator))
+
+    def _create_type_adapter(field_info: FieldInfo) -> 'TypeAdapter[Any]':
+        return TypeAdapter(Annotated[field_info.annotation, field_info])
+
+    class ModelField:  # type: ignore[no-redef]  # noqa: WPS440
+        __slots__ = (
+            'name',
+            'field_info',
+            'rapid_param_type',
+            'alias',
+            'required',
+            'type_',
+            '_type_adapter',
+            '_validate_python',
+            '_exact_type',
+        )
+
+        def __init__(self, *, name: str, field_info: FieldInfo, rapid_param_type: ParamType) -> None:
+            self.name = name
+            self.field_info = field_info
+            self.rapid_param_type = rapid_param_type
+
+            alias = field_info.alias
+            self.alias: str = alias if alias is not None else name
+            self.required: bool = field_info.is_required()
+            self.type_: Any = field_info.annotation
+
+            self._type_adapter: TypeAdapter[Any] = _get_type_adapter(field_info)
+            self._validate_python = self._type_adapter.validator.validate_python
+            # NOTE: an unconstrained scalar given a value of exactly its type is returned unchanged by pydantic
+            self._exact_type: Optional[Type[Any]] = (
+                self.type_ if not field_info.metadata and self.type_ in _EXACT_TYPE_PASSTHROUGH else None
+            )
 
         @property
         def default(self) -> Any:
-            if self.field_info.is_required():
+            if self.required:
                 return Undefined
             return self.field_info.get_default(call_default_factory=True)
 
         def get_default(self) -> Any:
             return self.field_info.get_default(call_default_factory=True)
 
-        @property
-        def type_(self) -> Any:
-            return self.field_info.annotation
-
-        def __post_init__(self) -> None:
-            self._type_adapter: TypeAdapter[Any] = TypeAdapter(Annotated[self.field_info.annotation, self.field_info])
-
         def validate(
             self,
             value: Any,
@@ -147,14 +176,17 @@ elif PYDANTIC_V2:
             *,
             loc: Tuple[Union[int, str], ...],
         ) -> ValidateReturn:
+            if type(value) is self._exact_type:  # noqa: WPS516
+                return value, None
+
             try:
                 return (
-                    self._type_adapter.validate_python(value, from_attributes=True),
+                    self._validate_python(value, from_attributes=True),
                     None,
                 )
             except ValidationError as exc:
                 return None, _regenerate_error_with_loc(
-                    errors=exc.errors(),
+                    errors=exc.errors(include_url=False),
                     loc_prefix=loc,
                 )
 
@@ -1,17 +1,28 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 from multidict import MultiMapping
 
 
-def parse_multi_params(
-        data: Union[MultiMapping[Any], Dict[str, Any]],
+def parse_multi_params(data: Union[MultiMapping[Any], Dict[str, Any]]) -> Dict[str, Union[Any, List[Any]]]:
+    if isinstance(data, dict):
+        return data
+
+    return dict(data)
+
+
+def parse_params_pairs(
+        pairs: Iterable[Tuple[str, Any]],
         *,
         parse_as_array: bool = False,
+        lower_keys: bool = False,
 ) -> Dict[str, Union[Any, List[Any]]]:
     if parse_as_array:
-        parsed_result: Dict[str, list[Any]] = {}
+        parsed_result: Dict[str, List[Any]] = {}
+
+        for name, value in pairs:
+            if lower_keys:
+                name = name.lower()
 
-        for name, value in data.items():
             if name in parsed_result:
                 parsed_result[name].append(value)
             else:
@@ -19,7 +30,7 @@ def parse_multi_params(
 
         return parsed_result
 
-    if isinstance(data, MultiMapping):
-        return dict(data)
+    if lower_keys:
+        return {pair_name.lower(): pair_value for pair_name, pair_value in pairs}
 
-    return data
+    return dict(pairs)
@@ -1,77 +1,108 @@
-from typing import Any, cast, Dict, List, Optional, Tuple
+from typing import Any, Callable, cast, Dict, List, NamedTuple, Optional, Tuple
 
-from rapidy._client_errors import _regenerate_error_with_loc, RequiredFieldIsMissing
+from rapidy._client_errors import RequiredFieldIsMissing
 from rapidy._fields import ModelField
 from rapidy.typedefs import DictStrAny, ErrorWrapper
 
+_IMMUTABLE_DEFAULT_TYPES = (type(None), bool, int, float, complex, str, bytes)
 
-def _validate_data_by_field(
-        raw_data: Optional[Any],
-        loc: Tuple[str, ...],
-        model_field: ModelField,
-        *,
-        values: DictStrAny,
-) -> Tuple[Optional[Any], List[Any]]:
-    if raw_data is None:
-        if model_field.required:
-            return values, [RequiredFieldIsMissing().get_error_info(loc=loc)]
+FieldLoc = Tuple[str, ...]
+FieldValidationResult = Tuple[Optional[Any], List[Any]]
+FieldValidator = Callable[[Optional[Any], FieldLoc, DictStrAny], FieldValidationResult]
 
-        return model_field.get_default(), []
 
-    validated_data, validated_errors = model_field.validate(raw_data, values, loc=loc)
-    if isinstance(validated_errors, ErrorWrapper):
-        return values, [validated_errors]
+class ValidationField(NamedTuple):
+    extraction_name: str
+    loc: FieldLoc
+    name: str
+    validate: FieldValidator
+
+
+def create_field_validator(model_field: ModelField) -> FieldValidator:
+    validate = model_field.validate
+
+    if model_field.required:
+        def validate_required_field(
+                raw_data: Optional[Any],
+                loc: FieldLoc,
+                values: DictStrAny,
+        ) -> FieldValidationResult:
+            if raw_data is None:
+                return values, [RequiredFieldIsMissing().get_error_info(loc=loc)]
+
+            validated_data, validated_errors = validate(raw_data, values, loc=loc)
+            if validated_errors is None:
+                return validated_data, []
+
+            return values, _convert_validation_errors(validated_errors)
+
+        return validate_required_field
+
+    get_default = _create_default_getter(model_field)
+
+    def validate_optional_field(
+            raw_data: Optional[Any],
+            loc: FieldLoc,
+            values: DictStrAny,
+    ) -> FieldValidationResult:
+        if raw_data is None:
+            return get_default(), []
+
+        validated_data, validated_errors = validate(raw_data, values, loc=loc)
+        if validated_errors is None:
+            return validated_data, []
+
+        return values, _convert_validation_errors(validated_errors)
+
+    return validate_optional_field
 
-    if isinstance(validated_errors, list):
-        converted_errors = _regenerate_error_with_loc(errors=validated_errors, loc_prefix=())
-        return values, converted_errors
 
-    return validated_data, []
+def _create_default_getter(model_field: ModelField) -> Callable[[], Any]:
+    default = model_field.field_info.default
+    is_immutable_default = type(default) in _IMMUTABLE_DEFAULT_TYPES  # noqa: WPS516
+    if model_field.field_info.default_factory is not None or not is_immutable_default:
+        # NOTE: pydantic returns a copy of a mutable default or calls the factory - on every call
+        return model_field.get_default
+
+    def get_immutable_default() -> Any:
+        return default
+
+    return get_immutable_default
+
+
+def _convert_validation_errors(validated_errors: Any) -> List[Any]:
+    if isinstance(validated_errors, ErrorWrapper):
+        return [validated_errors]
+
+    return cast(List[Any], validated_errors)
 
 
 def validate_request_param_data(
-        required_fields_map: Dict[str, ModelField],
+        validation_fields: Tuple[ValidationField, ...],
         raw_data: DictStrAny,
         is_single_model: bool,
 ) -> Tuple[DictStrAny, List[Any]]:
-    loc: Tuple[str, ...]
-
     if is_single_model:
-        model_field = list(required_fields_map.values())[0]
-
-        rapid_param_type = cast(str, model_field.rapid_param_type)
-
-        loc = (rapid_param_type,)
+        _, loc, field_name, validate_field = validation_fields[0]
 
-        validated_data, validated_errors = _validate_data_by_field(
-            raw_data=raw_data if raw_data else None,
-            values={},
-            loc=loc,
-            model_field=model_field,
-        )
+        validated_data, validated_errors = validate_field(raw_data if raw_data else None, loc, {})
         if validated_errors:
             return {}, validated_errors
 
-        return {model_field.name: validated_data}, validated_errors
+        return {field_name: validated_data}, validated_errors
 
     all_validated_values: Dict[str, Any] = {}
     all_validated_errors: List[Dict[str, Any]] = []
 
-    for required_field_name, model_field in required_fields_map.items():  # noqa: WPS440
-        rapid_param_type = cast(str, model_field.rapid_param_type)
-
-        loc = (rapid_param_type, model_field.alias)
-        raw_param_data = raw_data.get(required_field_name)
-
-        validated_data, validated_errors = _validate_data_by_field(
-            raw_data=raw_param_data,
-            values=all_validated_values,
-            loc=loc,
-            model_field=model_field,
+    for extraction_name, field_loc, field_name, validate_field in validation_fields:  # noqa: WPS440
+        validated_data, validated_errors = validate_field(
+            raw_data.get(extraction_name),
+            field_loc,
+            all_validated_values,
         )
         if validated_errors:
             all_validated_errors.extend(validated_errors)
         else:
-            all_validated_values[model_field.name] = validated_data
+            all_validated_values[field_name] = validated_data
 
     return all_validated_values, all_validated_errors
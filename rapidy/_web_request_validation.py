@@ -1,5 +1,6 @@
-from functools import partial, wraps
-from typing import Any, cast, Dict, List, Type, TYPE_CHECKING
+import inspect
+from functools import wraps
+from typing import Any, cast, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
 from rapidy import hdrs
 from rapidy._annotation_container import AnnotationContainer, create_annotation_container
@@ -18,7 +19,6 @@ async def validate_request(
         request: 'Request',
         *,
         annotation_container: AnnotationContainer,
-        errors_response_field_name: str,
 ) -> Dict[str, Any]:
     values: Dict[str, Any] = {}
     errors: List[Dict[str, Any]] = []
@@ -26,13 +26,13 @@ async def validate_request(
     for param_container in annotation_container:
         param_values, param_errors = await param_container.get_request_data(request)
         if param_errors:
-            errors += param_errors
+            errors.extend(param_errors)
         else:
             values.update(cast(Dict[str, Any], param_values))
 
     if errors:
         raise HTTPValidationFailure(
-            validation_failure_field_name=errors_response_field_name,
+            validation_failure_field_name=request._cache['errors_response_field_name'],  # FIXME
             errors=_normalize_errors(errors),
         )
 
@@ -42,60 +42,73 @@ async def validate_request(
 def handler_validation_wrapper(handler: Handler) -> Handler:
     annotation_container = create_annotation_container(handler, is_func_handler=True)
 
+    if annotation_container.request_exists:
+        return _handler_with_request_validation_wrapper(
+            handler,
+            annotation_container,
+            annotation_container.request_param_name,
+        )
+
     @wraps(handler)
     async def inner(request: 'Request') -> StreamResponse:
         validated_data = await validate_request(
             request=request,
             annotation_container=annotation_container,
-            errors_response_field_name=request._cache['errors_response_field_name'],  # FIXME
         )
+        return await handler(**validated_data)
+
+    return inner
 
-        if annotation_container.request_exists:
-            validated_data[annotation_container.request_param_name] = request
 
+def _handler_with_request_validation_wrapper(
+        handler: Handler,
+        annotation_container: AnnotationContainer,
+        request_param_name: str,
+) -> Handler:
+    @wraps(handler)
+    async def inner(request: 'Request') -> StreamResponse:
+        validated_data = await validate_request(
+            request=request,
+            annotation_container=annotation_container,
+        )
+        validated_data[request_param_name] = request
         return await handler(**validated_data)
 
     return inner
 
 
 def view_validation_wrapper(view: Type['View']) -> 'View':
-    annotation_containers = {}
-
-    for method in (  # noqa: WPS335 WPS352
-        handler_attr
-        for handler_attr in dir(view)
-        if handler_attr.upper() in hdrs.METH_ALL
-    ):
-        method_handler: MethodHandler = getattr(view, method)
-
-        annotation_containers[method.lower()] = create_annotation_container(method_handler)
+    view_method_handlers: Dict[str, Tuple[AnnotationContainer, Any]] = {}
+
+    for method in hdrs.METH_ALL:
+        method_name = method.lower()
+        method_handler: Optional[MethodHandler] = getattr(view, method_name, None)
+        if method_handler is None:
+            continue
+
+        # NOTE: the raw class attribute is kept, so static and class methods are bound like aiohttp `View` binds them
+        view_method_handlers[method] = (
+            create_annotation_container(method_handler),
+            inspect.getattr_static(view, method_name),
+        )
 
     @wraps(view)
     async def inner(request: 'Request') -> StreamResponse:
         instance_view = view(request)
-        method_name = request.method.lower()
 
         try:
-            annotation_container = annotation_containers[method_name]
+            annotation_container, method_descriptor = view_method_handlers[request.method]
         except KeyError:
             instance_view._raise_allowed_methods()
             raise  # for linters only
 
-        try:
-            method = getattr(instance_view, method_name)  # noqa: WPS442
-        except AttributeError:
-            instance_view._raise_allowed_methods()
-            raise  # for linters only
-
         validated_data = await validate_request(
             request=request,
             annotation_container=annotation_container,
-            errors_response_field_name=request._cache['errors_response_field_name'],  # FIXME
         )
 
-        setattr(instance_view, method_name, partial(method, **validated_data))
-
-        return await instance_view
+        method = method_descriptor.__get__(instance_view, view)  # noqa: WPS609
+        return await method(**validated_data)
 
     return inner
 
@@ -111,7 +124,6 @@ def middleware_validation_wrapper(middleware: Middleware) -> Middleware:
         validated_data = await validate_request(
             request=request,
             annotation_container=annotation_container,
-            errors_response_field_name=request._cache['errors_response_field_name'],  # FIXME
         )
         return await middleware(request, handler, **validated_data)
 
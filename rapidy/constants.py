@@ -2,8 +2,9 @@ from typing import Final
 
 from pydantic.version import VERSION as PYDANTIC_VERSION
 
-PYDANTIC_V1: Final[bool] = PYDANTIC_VERSION.startswith('1.')
-PYDANTIC_V2: Final[bool] = PYDANTIC_VERSION.startswith('2.')
+PYDANTIC_MAJOR: Final[int] = int(PYDANTIC_VERSION.partition('.')[0])
+PYDANTIC_V1: Final[bool] = PYDANTIC_MAJOR == 1
+PYDANTIC_V2: Final[bool] = PYDANTIC_MAJOR == 2
 
 CLIENT_MAX_SIZE: Final[int] = 1024 ** 2
 MAX_BODY_SIZE: Final[int] = 1024 ** 2
@@ -28,19 +28,30 @@ InnerDeco = Callable[[], Coroutine[Any, Any, None]]
 
 
 def hide_server_info_deco(show_server_info_in_response: bool = False) -> Callable[[Any], InnerDeco]:
-    def deco(prepare_headers_bound_method: Any) -> InnerDeco:
-        response = prepare_headers_bound_method.__self__
+    if show_server_info_in_response:
+        return _show_server_info_deco
 
-        async def inner() -> None:
-            await prepare_headers_bound_method()
-            if show_server_info_in_response:
-                response._headers[hdrs.SERVER] = SERVER_INFO
-            else:
-                response._headers.pop(hdrs.SERVER)
+    return _hide_server_info_deco
+
+
+def _show_server_info_deco(prepare_headers_bound_method: Any) -> InnerDeco:
+    response = prepare_headers_bound_method.__self__
+
+    async def inner() -> None:
+        await prepare_headers_bound_method()
+        response._headers[hdrs.SERVER] = SERVER_INFO
+
+    return inner
+
+
+def _hide_server_info_deco(prepare_headers_bound_method: Any) -> InnerDeco:
+    response = prepare_headers_bound_method.__self__
 
-        return inner
+    async def inner() -> None:
+        await prepare_headers_bound_method()
+        response._headers.pop(hdrs.SERVER)
 
-    return deco
+    return inner
 
 
 class Application(AiohttpApplication):
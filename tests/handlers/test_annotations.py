@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Any, Optional, Type
+from typing import Any, Optional, Type, Union
 
 import pytest
 from pydantic import BaseModel
@@ -218,6 +218,24 @@ async def test_failed_schema_annotation(param: Any, create_handler_func: Any) ->
     assert exc_message.startswith(EXTRACT_SCHEMA_TYPE_ERR_MSG)
 
 
+@pytest.mark.parametrize(
+    'type_', [
+        Union[SchemaPydantic, None],
+        Union[None, SchemaPydantic],
+        Union[None, SchemaDataclass],
+    ],
+)
+async def test_success_optional_schema_annotation(aiohttp_client: AiohttpClient, type_: Any) -> None:
+    handler = _create_annotated_def_handler(type_, JsonBodySchema)
+
+    app = web.Application()
+    app.add_routes([web.post('/', handler)])
+    client = await aiohttp_client(app)
+    resp = await client.post('/', json={'attr': ''})
+
+    assert resp.status == HTTPStatus.OK
+
+
 @pytest.mark.parametrize(
     'attr_type', [
         Annotated[str, str],
@@ -115,6 +115,32 @@ def _create_class_extended_handler_success(type_: Any, param: Any, expected_data
     return Foo
 
 
+def _create_class_handler_as_static_method_def(type_: Any, param: Any, expected_data: Any) -> Any:
+    class Foo(web.View):
+        @staticmethod
+        async def post(
+                attr: type_ = param,
+        ) -> web.Response:
+            assert attr == expected_data
+            return web.Response()
+
+    return Foo
+
+
+def _create_class_handler_as_class_method_def(type_: Any, param: Any, expected_data: Any) -> Any:
+    class Foo(web.View):
+        @classmethod
+        async def post(
+                cls,
+                attr: type_ = param,
+        ) -> web.Response:
+            assert cls is Foo
+            assert attr == expected_data
+            return web.Response()
+
+    return Foo
+
+
 success_definition_test_parameters = [
     param(str, Header, {'headers': {'attr': 'attr'}}, 'attr', id='header-param'),
     param(str, Cookie, {'cookies': {'attr': 'attr'}}, 'attr', id='cookie-param'),
@@ -143,6 +169,8 @@ create_view_parameters = [
     param(_create_class_handler_as_annotated_def, id='attr-definition-as-annotated'),
     param(_create_class_handler_as_default_def, id='attr-definition-as-default'),
     param(_create_class_extended_handler_success, id='extended-view'),
+    param(_create_class_handler_as_static_method_def, id='static-method-view'),
+    param(_create_class_handler_as_class_method_def, id='class-method-view'),
 ]
 
 
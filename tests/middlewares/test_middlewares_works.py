@@ -7,7 +7,7 @@ from pytest_aiohttp.plugin import AiohttpClient
 from typing_extensions import Annotated, Final
 
 from rapidy import web
-from rapidy.request_params import Header, TextBody
+from rapidy.request_params import Header, QueryRaw, TextBody
 from rapidy.typedefs import HandlerType, Middleware
 from rapidy.web import middleware
 
@@ -179,3 +179,25 @@ async def test_unsupported_old_style_middleware(aiohttp_client: AiohttpClient) -
         data=BODY_DATA,
     )
     assert resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@pytest.mark.parametrize('query', [{'attr': 'value'}, {}])
+async def test_middleware_and_handler_extract_same_raw_param(aiohttp_client: AiohttpClient, query: Any) -> None:
+    @middleware
+    async def query_middleware(
+            request: web.Request,
+            handler: HandlerType,
+            middleware_query: Annotated[Any, QueryRaw],
+    ) -> web.StreamResponse:
+        assert middleware_query == query
+        return await handler(request)
+
+    async def handler(handler_query: Annotated[Any, QueryRaw]) -> web.Response:
+        assert handler_query == query
+        return web.Response()
+
+    app = web.Application(middlewares=[query_middleware])
+    app.add_routes([web.get('/', handler)])
+    client = await aiohttp_client(app)
+    resp = await client.get('/', params=query)
+    assert resp.status == HTTPStatus.OK
@@ -0,0 +1,66 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from rapidy._client_errors import _normalize_errors, BodyDataSizeExceedError, ExtractBodyError, RequiredFieldIsMissing
+from rapidy.constants import PYDANTIC_V1
+
+
+def test_normalized_client_error_info() -> None:
+    error_info = RequiredFieldIsMissing().get_error_info(loc=('query', 'attr'))
+
+    normalized_errors = _normalize_errors([error_info])
+
+    assert len(normalized_errors) == 1
+    assert 'input' not in normalized_errors[0]
+    assert normalized_errors[0]['loc'] == ('query', 'attr')
+
+
+def test_client_error_info() -> None:
+    error_info = BodyDataSizeExceedError(body_max_size=1).get_error_info(loc=('body',))
+
+    assert error_info == {
+        'loc': ('body',),
+        'msg': 'Failed to extract body data. Body data exceeds the allowed size `1`',
+        'type': 'body_extraction',
+    }
+
+
+def test_required_field_is_missing_matches_pydantic_error() -> None:
+    class Schema(BaseModel):
+        attr: int
+
+    with pytest.raises(ValidationError) as exc_info:
+        Schema()
+
+    pydantic_error = exc_info.value.errors()[0]
+    pydantic_error.pop('url', None)
+    pydantic_error.pop('input', None)
+
+    error_info = RequiredFieldIsMissing().get_error_info(loc=('attr',))
+
+    assert error_info == pydantic_error
+    assert list(error_info) == list(pydantic_error)
+
+
+@pytest.mark.skipif(not PYDANTIC_V1, reason='nested error lists are produced by pydantic v1 only')
+def test_normalize_nested_errors_keeps_order() -> None:
+    errors = [
+        {'loc': ('a',)},
+        [{'loc': ('b',)}, [{'loc': ('c',)}]],
+        {'loc': ('d',)},
+    ]
+
+    assert _normalize_errors(errors) == [{'loc': ('a',)}, {'loc': ('b',)}, {'loc': ('c',)}, {'loc': ('d',)}]
+
+
+def test_client_error_msg_template_rendering() -> None:
+    class PercentError(ExtractBodyError):
+        msg_template = 'Body is 100% broken: `{reason}`'
+
+    assert PercentError(reason='50%')._err_msg == 'Body is 100% broken: `50%`'
+
+
+def test_client_error_msg_template_with_format_spec_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        class FormatSpecError(ExtractBodyError):  # noqa: F841
+            msg_template = 'Body size `{size:>10}`'
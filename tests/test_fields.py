@@ -0,0 +1,91 @@
+import inspect
+from typing import Any
+
+import pytest
+
+from rapidy._validators import create_field_validator
+from rapidy.constants import PYDANTIC_V2
+from rapidy.request_params import create_param_model_field_by_request_param, Query
+
+
+def _create_query_field(name: str, annotated_type: Any = int, **field_kwargs: Any) -> Any:
+    return create_param_model_field_by_request_param(
+        annotated_type=annotated_type,
+        field_info=Query(**field_kwargs),
+        param_name=name,
+        param_default=inspect.Signature.empty,
+        param_default_factory=None,
+    )
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='TypeAdapter exists in pydantic v2 only')
+def test_type_adapter_shared_by_equal_fields() -> None:
+    first_field = _create_query_field('first')
+    second_field = _create_query_field('second', alias='other')
+    constrained_field = _create_query_field('constrained', gt=1)
+
+    assert first_field._type_adapter is second_field._type_adapter
+    assert first_field._type_adapter is not constrained_field._type_adapter
+
+    assert first_field.validate(0, loc=('query', 'first')) == (0, None)
+    _, errors = constrained_field.validate(0, loc=('query', 'constrained'))
+    assert errors[0]['type'] == 'greater_than'
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='TypeAdapter exists in pydantic v2 only')
+def test_equal_constraints_of_different_types_not_shared() -> None:
+    float_limit_field = _create_query_field('float_limit', Any, gt=1.0)
+    int_limit_field = _create_query_field('int_limit', Any, gt=1)
+
+    _, float_limit_errors = float_limit_field.validate(0, loc=('query', 'float_limit'))
+    _, int_limit_errors = int_limit_field.validate(0, loc=('query', 'int_limit'))
+
+    assert type(float_limit_errors[0]['ctx']['gt']) is float
+    assert type(int_limit_errors[0]['ctx']['gt']) is int
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='TypeAdapter exists in pydantic v2 only')
+def test_exact_type_value_passthrough() -> None:
+    field = _create_query_field('field')
+    constrained_field = _create_query_field('constrained', gt=1)
+
+    assert field.validate(True, loc=('query', 'field')) == (1, None)
+    assert type(field.validate(True, loc=('query', 'field'))[0]) is int
+    assert field.validate('2', loc=('query', 'field')) == (2, None)
+    assert constrained_field.validate(0, loc=('query', 'constrained'))[1]
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason='TypeAdapter exists in pydantic v2 only')
+def test_exact_type_value_skips_validator() -> None:
+    field = _create_query_field('field')
+
+    def validate_python(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError('the validator must not be called for an exact type value')
+
+    field._validate_python = validate_python
+    value = 10 ** 20
+
+    validated_value, errors = field.validate(value, loc=('query', 'field'))
+
+    assert validated_value is value
+    assert errors is None
+
+
+@pytest.mark.parametrize('param_default', [None, 1, 'default', [1]])
+def test_field_validator_returns_default(param_default: Any) -> None:
+    field = create_param_model_field_by_request_param(
+        annotated_type=Any,
+        field_info=Query(),
+        param_name='field',
+        param_default=param_default,
+        param_default_factory=None,
+    )
+    validate_field = create_field_validator(field)
+
+    first_value, first_errors = validate_field(None, ('query', 'field'), {})
+    second_value, second_errors = validate_field(None, ('query', 'field'), {})
+
+    assert first_value == second_value == param_default
+    assert first_errors == second_errors == []
+    if isinstance(param_default, list):
+        assert first_value is not second_value